@@ -1,10 +1,21 @@
+import asyncio
+import logging
 import os
+import re
+from datetime import datetime, timezone
 from typing import List, Optional
-from fastapi import FastAPI, HTTPException, Depends
+import orjson
+from cachetools import TTLCache
+from fastapi import FastAPI, Header, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError, OperationFailure
 
-from database import db, create_document, get_documents
+from database import db, _client, create_document, create_documents, get_documents
 from schemas import (
     User,
     CreatorProfile,
@@ -17,40 +28,151 @@ from schemas import (
     Report,
 )
 
-app = FastAPI(title="Exclusive Creator Content Platform API", version="0.1.0")
+class MongoORJSONResponse(ORJSONResponse):
+    # orjson handles datetime/UUID natively; anything else BSON-flavored
+    # (e.g. a stray ObjectId) falls back to str()
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=str)
+
+
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="Exclusive Creator Content Platform API", version="0.1.0",
+              default_response_class=MongoORJSONResponse)
+
+# Wildcard + credentials is invalid per the CORS spec and forces the
+# middleware to reflect the Origin header on every request. Default stays
+# open for the demo, but credentials are only enabled with an explicit
+# allowlist (CORS_ORIGINS=https://app.example.com,...), which lets the
+# middleware use its fast exact-match path.
+_cors_origins = [o.strip() for o in os.getenv("CORS_ORIGINS", "*").split(",") if o.strip()]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=_cors_origins,
+    allow_credentials="*" not in _cors_origins,
+    allow_methods=["GET", "POST"],
+    allow_headers=["x-api-key", "content-type"],
 )
 
+async def _ensure_index(collection_name: str, keys, **kwargs):
+    # Guarded per index: one conflict (same name/different options, duplicate
+    # values blocking a unique build) must not disable the indexes after it,
+    # and the creator_stats hints depend on theirs existing
+    try:
+        await db[collection_name].create_index(keys, **kwargs)
+    except OperationFailure as exc:
+        logger.warning("Could not create index on %s %r: %s", collection_name, keys, exc)
+
+
+@app.on_event("startup")
+async def ensure_indexes():
+    # Back every hot filter with an index so the queries below stay index
+    # scans instead of collection scans as data grows
+    if db is None:
+        return
+    await _ensure_index("subscription", [("user_id", 1), ("creator_id", 1), ("active", 1)])
+    await _ensure_index("subscription", [("creator_id", 1), ("active", 1)])
+    await _ensure_index("post", "creator_id")
+    await _ensure_index("post", [("creator_id", 1), ("is_draft", 1), ("access_level_required", 1)])
+    await _ensure_index("tokentransaction", [("to_user_id", 1), ("kind", 1)])
+    await _ensure_index("subscriptiontier", "creator_id")
+    await _ensure_index("comment", "post_id")
+    # Partial, not sparse: users created without an api_key store an explicit
+    # null, which a sparse unique index would still collide on
+    await _ensure_index("user", "api_key", unique=True,
+                        partialFilterExpression={"api_key": {"$type": "string"}})
+    await _ensure_index("creatorprofile", "handle", unique=True)
+
+
+# Cap batch endpoints; beyond this size the per-RTT amortization flattens out
+MAX_BATCH_SIZE = 1000
+
+
+def _check_batch(items: list):
+    if not items:
+        raise HTTPException(status_code=400, detail="Batch must not be empty")
+    if len(items) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"Batch size exceeds {MAX_BATCH_SIZE}")
+
+
+# Page-size cap for list endpoints; clients page with keyset cursors
+MAX_PAGE_SIZE = 500
+
+
+def _paged(filter_dict: dict, limit: int, cursor: Optional[str]):
+    # Keyset pagination on _id: O(log n) seek, unlike skip which walks n docs
+    if cursor:
+        try:
+            filter_dict["_id"] = {"$lt": ObjectId(cursor)}
+        except InvalidId:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    return filter_dict, min(max(limit, 1), MAX_PAGE_SIZE)
+
+
+def _serialize_ids(items: list) -> list:
+    # Rename _id -> id in place: one pass per doc instead of rebuilding each
+    # dict with a comprehension plus a merge
+    for doc in items:
+        doc["id"] = str(doc.pop("_id"))
+    return items
+
+
 # --- Simple demo auth via API key in header ---
 class AuthUser(BaseModel):
     user_id: str
     is_creator: bool = False
 
 
-def get_current_user(x_api_key: Optional[str] = None) -> Optional[AuthUser]:
+# Successful api_key lookups are served from process memory for up to 60s,
+# turning the per-request auth query into a dict lookup at steady state
+_auth_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+async def get_current_user(
+    x_api_key: Optional[str] = Header(default=None, alias="X-API-Key"),
+) -> Optional[AuthUser]:
     # Demo auth: if header is provided, try to find user by api_key
     # In production replace with JWT/auth provider
+    # Attach via Depends(get_current_user) (router-level for whole groups)
     if x_api_key is None:
         return None
-    user = db["user"].find_one({"api_key": x_api_key}) if db else None
+    cached = _auth_cache.get(x_api_key)
+    if cached is not None:
+        return cached
+    user = await db["user"].find_one({"api_key": x_api_key}) if db is not None else None
     if not user:
         return None
-    return AuthUser(user_id=str(user.get("_id")), is_creator=bool(user.get("is_creator", False)))
+    auth_user = AuthUser(user_id=str(user.get("_id")), is_creator=bool(user.get("is_creator", False)))
+    _auth_cache[x_api_key] = auth_user
+    return auth_user
 
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Creator Platform API running"}
 
 
+# The collection list rarely changes but /test is polled by load balancers;
+# cache it briefly and stop listing after ten names instead of fetching all
+_collections_cache: TTLCache = TTLCache(maxsize=1, ttl=10)
+
+
+async def _sample_collection_names(limit: int = 10) -> list:
+    names = _collections_cache.get("names")
+    if names is None:
+        names = []
+        # Motor's list_collections() is a coroutine returning the cursor
+        async for coll in await db.list_collections():
+            names.append(coll["name"])
+            if len(names) >= limit:
+                break
+        _collections_cache["names"] = names
+    return names
+
+
 @app.get("/test")
-def test_database():
+async def test_database():
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -63,7 +185,7 @@ def test_database():
         if db is not None:
             response["database"] = "✅ Connected"
             response["connection_status"] = "Connected"
-            response["collections"] = db.list_collection_names()[:10]
+            response["collections"] = await _sample_collection_names()
     except Exception as e:
         response["database"] = f"⚠️ Error: {str(e)[:80]}"
     return response
@@ -71,87 +193,215 @@ def test_database():
 
 # --- User & Creator endpoints ---
 @app.post("/api/users", response_model=dict)
-def create_user(user: User):
+async def create_user(user: User):
     # Enforce non-adult policy via categories later at content level
-    inserted_id = create_document("user", user)
+    try:
+        inserted_id = await create_document("user", user)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="API key already in use")
     return {"id": inserted_id}
 
 
 @app.post("/api/creators/profile", response_model=dict)
-def create_creator_profile(profile: CreatorProfile):
-    # Ensure the referenced user exists and is creator
-    u = db["user"].find_one({"_id": {"$eq": db.client.get_default_database().codec_options.uuid_representation}}) if False else None
-    # We skip heavy validation for demo; rely on front-end flow
-    inserted_id = create_document("creatorprofile", profile)
+async def create_creator_profile(profile: CreatorProfile):
+    # Ensure the referenced user exists and is a creator (_id-indexed lookup)
+    exists = await db["user"].find_one({"_id": profile.user_id, "is_creator": True}, projection={"_id": 1})
+    if not exists:
+        raise HTTPException(status_code=404, detail="Creator user not found")
+    try:
+        inserted_id = await create_document("creatorprofile", profile)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Handle already taken")
     return {"id": inserted_id}
 
 
 @app.post("/api/creators/tiers", response_model=dict)
-def create_tier(tier: SubscriptionTier):
-    inserted_id = create_document("subscriptiontier", tier)
+async def create_tier(tier: SubscriptionTier):
+    inserted_id = await create_document("subscriptiontier", tier)
     return {"id": inserted_id}
 
 
+@app.post("/api/creators/tiers/batch", response_model=dict)
+async def create_tiers_batch(tiers: List[SubscriptionTier]):
+    _check_batch(tiers)
+    ids = await create_documents("subscriptiontier", tiers)
+    return {"ids": ids}
+
+
 @app.get("/api/creators/{creator_id}/tiers")
-def list_tiers(creator_id: str):
-    items = get_documents("subscriptiontier", {"creator_id": creator_id})
-    return [{**{k: v for k, v in doc.items() if k != "_id"}, "id": str(doc.get("_id"))} for doc in items]
+async def list_tiers(creator_id: str, limit: int = 50, cursor: Optional[str] = None):
+    flt, limit = _paged({"creator_id": creator_id}, limit, cursor)
+    items = await get_documents("subscriptiontier", flt, limit=limit, sort=[("_id", -1)])
+    items = _serialize_ids(items)
+    return {"items": items, "next_cursor": items[-1]["id"] if len(items) == limit else None}
 
 
 # --- Content endpoints ---
 @app.post("/api/media", response_model=dict)
-def upload_media(asset: MediaAsset):
+async def upload_media(asset: MediaAsset):
     # For MVP we only store references (URL). Real uploads would use S3, etc.
-    inserted_id = create_document("mediaasset", asset)
+    inserted_id = await create_document("mediaasset", asset)
     return {"id": inserted_id}
 
 
+@app.post("/api/media/batch", response_model=dict)
+async def upload_media_batch(assets: List[MediaAsset]):
+    _check_batch(assets)
+    ids = await create_documents("mediaasset", assets)
+    return {"ids": ids}
+
+
 @app.post("/api/posts", response_model=dict)
-def create_post(post: Post):
-    inserted_id = create_document("post", post)
+async def create_post(post: Post):
+    inserted_id = await create_document("post", post)
     return {"id": inserted_id}
 
 
+@app.post("/api/posts/batch", response_model=dict)
+async def create_posts_batch(posts: List[Post]):
+    # One insert_many round trip instead of one insert per document
+    _check_batch(posts)
+    ids = await create_documents("post", posts)
+    return {"ids": ids}
+
+
 @app.get("/api/creators/{creator_id}/posts")
-def list_posts(creator_id: str, tier_level: int = 1):
-    # Gate by access_level_required
-    items = get_documents("post", {"creator_id": creator_id, "is_draft": False, "access_level_required": {"$lte": tier_level}})
-    return [{**{k: v for k, v in doc.items() if k != "_id"}, "id": str(doc.get("_id"))} for doc in items]
+async def list_posts(creator_id: str, tier_level: int = 1, limit: int = 50, cursor: Optional[str] = None):
+    # Gate by access_level_required; project to the fields the feed renders
+    # so we do not ship body_text for every row
+    flt, limit = _paged({"creator_id": creator_id, "is_draft": False, "access_level_required": {"$lte": tier_level}}, limit, cursor)
+    items = await get_documents("post", flt, limit=limit,
+                                projection={"title": 1, "access_level_required": 1, "published_at": 1, "media_ids": 1},
+                                sort=[("_id", -1)])
+    items = _serialize_ids(items)
+    return {"items": items, "next_cursor": items[-1]["id"] if len(items) == limit else None}
 
 
 # --- Subscriptions ---
 @app.post("/api/subscribe", response_model=dict)
-def subscribe(sub: Subscription):
+async def subscribe(sub: Subscription):
     # Payment is out of scope; assume success for demo
-    inserted_id = create_document("subscription", sub)
+    inserted_id = await create_document("subscription", sub)
     return {"id": inserted_id}
 
 
+@app.post("/api/subscribe/batch", response_model=dict)
+async def subscribe_batch(subs: List[Subscription]):
+    _check_batch(subs)
+    ids = await create_documents("subscription", subs)
+    return {"ids": ids}
+
+
 @app.get("/api/users/{user_id}/subscriptions")
-def list_subscriptions(user_id: str):
-    items = get_documents("subscription", {"user_id": user_id, "active": True})
-    return [{**{k: v for k, v in doc.items() if k != "_id"}, "id": str(doc.get("_id"))} for doc in items]
+async def list_subscriptions(user_id: str, limit: int = 50, cursor: Optional[str] = None):
+    flt, limit = _paged({"user_id": user_id, "active": True}, limit, cursor)
+    items = await get_documents("subscription", flt, limit=limit, sort=[("_id", -1)])
+    items = _serialize_ids(items)
+    return {"items": items, "next_cursor": items[-1]["id"] if len(items) == limit else None}
 
 
 # --- Tokens ---
+# Token transactions are an append-only audit log the caller never reads
+# back in-request, so they are queued and flushed in batches off the
+# critical path instead of costing a round trip per purchase/tip
+_tx_queue: asyncio.Queue = asyncio.Queue()
+_tx_flush_task: Optional[asyncio.Task] = None
+TX_FLUSH_INTERVAL = 0.05
+TX_FLUSH_BATCH = 500
+
+
+def _record_transaction(tx: TokenTransaction):
+    doc = tx.model_dump()
+    doc["created_at"] = datetime.now(timezone.utc)
+    doc["updated_at"] = doc["created_at"]
+    _tx_queue.put_nowait(doc)
+
+
+async def _insert_transactions(batch: list, attempts: int = 3):
+    # These are financial audit records: retry transient failures and never
+    # drop a batch without a trace
+    for attempt in range(1, attempts + 1):
+        # Shield the write so a shutdown cancel cannot abandon an insert
+        # already on the wire; the batch must be written exactly once
+        task = asyncio.ensure_future(db["tokentransaction"].insert_many(batch, ordered=False))
+        try:
+            await asyncio.shield(task)
+            return
+        except asyncio.CancelledError:
+            try:
+                await task
+            except Exception:
+                logger.exception("Dropping %d token transactions: flush failed during shutdown", len(batch))
+            raise
+        except Exception:
+            logger.exception("tokentransaction flush failed (attempt %d/%d)", attempt, attempts)
+            if attempt < attempts:
+                await asyncio.sleep(TX_FLUSH_INTERVAL * attempt)
+    logger.error("Dropping %d token transactions after %d failed insert attempts", len(batch), attempts)
+
+
+async def _flush_transactions():
+    while True:
+        batch = [await _tx_queue.get()]
+        try:
+            # Give the batch a moment to fill, then drain what is waiting
+            await asyncio.sleep(TX_FLUSH_INTERVAL)
+            while len(batch) < TX_FLUSH_BATCH and not _tx_queue.empty():
+                batch.append(_tx_queue.get_nowait())
+        except asyncio.CancelledError:
+            # Shutdown before the batch was handed to the insert path: put it
+            # back so the drain hook writes it exactly once. Once handed off,
+            # _insert_transactions shields the write instead, so a batch is
+            # never both inserted and re-enqueued.
+            for doc in batch:
+                _tx_queue.put_nowait(doc)
+            raise
+        await _insert_transactions(batch)
+
+
+@app.on_event("startup")
+async def start_transaction_flusher():
+    global _tx_flush_task
+    if db is not None:
+        _tx_flush_task = asyncio.create_task(_flush_transactions())
+
+
+@app.on_event("shutdown")
+async def drain_transaction_queue():
+    if _tx_flush_task is not None:
+        _tx_flush_task.cancel()
+        try:
+            # Wait for the flusher to re-enqueue any batch it had in flight
+            await _tx_flush_task
+        except asyncio.CancelledError:
+            pass
+    batch = []
+    while not _tx_queue.empty():
+        batch.append(_tx_queue.get_nowait())
+    if batch and db is not None:
+        await _insert_transactions(batch)
+
+
 class PurchaseTokensRequest(BaseModel):
     user_id: str
     amount: int
 
 
 @app.post("/api/tokens/purchase")
-def purchase_tokens(payload: PurchaseTokensRequest):
+async def purchase_tokens(payload: PurchaseTokensRequest):
     if payload.amount <= 0:
         raise HTTPException(status_code=400, detail="Amount must be positive")
-    user = db["user"].find_one({"_id": {"$eq": payload.user_id}})
-    if not user:
-        # Allow creation-lite for demo
-        db["user"].insert_one({"_id": payload.user_id, "name": "Guest", "email": "guest@example.com", "token_balance": 0, "is_creator": False})
-        user = db["user"].find_one({"_id": {"$eq": payload.user_id}})
-    new_balance = int(user.get("token_balance", 0)) + payload.amount
-    db["user"].update_one({"_id": user["_id"]}, {"$set": {"token_balance": new_balance}})
-    create_document("tokentransaction", TokenTransaction(from_user_id=None, to_user_id=None, amount=payload.amount, kind="purchase"))
-    return {"token_balance": new_balance}
+    # Single atomic upsert: credits the balance and creates the demo user on
+    # first purchase, with no read-modify-write window
+    user = await db["user"].find_one_and_update(
+        {"_id": payload.user_id},
+        {"$inc": {"token_balance": payload.amount},
+         "$setOnInsert": {"name": "Guest", "email": "guest@example.com", "is_creator": False}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    _record_transaction(TokenTransaction(from_user_id=None, to_user_id=None, amount=payload.amount, kind="purchase"))
+    return {"token_balance": user["token_balance"]}
 
 
 class TipRequest(BaseModel):
@@ -162,42 +412,52 @@ class TipRequest(BaseModel):
 
 
 @app.post("/api/tokens/tip")
-def tip_creator(payload: TipRequest):
+async def tip_creator(payload: TipRequest):
     if payload.amount <= 0:
         raise HTTPException(status_code=400, detail="Amount must be positive")
-    from_user = db["user"].find_one({"_id": {"$eq": payload.from_user_id}})
-    to_user = db["user"].find_one({"_id": {"$eq": payload.to_user_id}})
-    if not from_user or not to_user:
-        raise HTTPException(status_code=404, detail="User not found")
-    balance = int(from_user.get("token_balance", 0))
-    if balance < payload.amount:
-        raise HTTPException(status_code=400, detail="Insufficient tokens")
-    # Deduct and credit
-    db["user"].update_one({"_id": from_user["_id"]}, {"$inc": {"token_balance": -payload.amount}})
-    db["user"].update_one({"_id": to_user["_id"]}, {"$inc": {"token_balance": payload.amount}})
-    create_document("tokentransaction", TokenTransaction(from_user_id=payload.from_user_id, to_user_id=payload.to_user_id, amount=payload.amount, kind="tip", note=None, post_id=payload.post_id))
+    # Debit and credit commit atomically in one transactional bulk_write; the
+    # balance check lives in the debit filter so concurrent tips cannot
+    # overdraw. Requires MongoDB running as a replica set (see README).
+    async with await _client.start_session() as session:
+        async with session.start_transaction():
+            result = await db["user"].bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": payload.from_user_id, "token_balance": {"$gte": payload.amount}},
+                        {"$inc": {"token_balance": -payload.amount}},
+                    ),
+                    UpdateOne({"_id": payload.to_user_id}, {"$inc": {"token_balance": payload.amount}}),
+                ],
+                session=session,
+            )
+            if result.matched_count != 2:
+                # Raising aborts the transaction, rolling back both writes
+                raise HTTPException(status_code=400, detail="Insufficient tokens or user not found")
+    _record_transaction(TokenTransaction(from_user_id=payload.from_user_id, to_user_id=payload.to_user_id, amount=payload.amount, kind="tip", note=None, post_id=payload.post_id))
     return {"ok": True}
 
 
 # --- Comments (subscriber-only, light check) ---
 @app.post("/api/comments", response_model=dict)
-def add_comment(comment: Comment):
-    # Minimal gating: ensure user has an active subscription to the creator who owns the post
-    post = db["post"].find_one({"_id": {"$eq": comment.post_id}})
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
-    creator_id = post.get("creator_id")
-    has_sub = db["subscription"].find_one({"user_id": comment.user_id, "creator_id": creator_id, "active": True})
+async def add_comment(comment: Comment):
+    # Minimal gating: creator_id is denormalized onto the comment payload, so
+    # one indexed subscription lookup replaces the post fetch + sub check
+    has_sub = await db["subscription"].find_one(
+        {"user_id": comment.user_id, "creator_id": comment.creator_id, "active": True},
+        projection={"_id": 1},
+    )
     if not has_sub:
         raise HTTPException(status_code=403, detail="Subscription required")
-    inserted_id = create_document("comment", comment)
+    inserted_id = await create_document("comment", comment)
     return {"id": inserted_id}
 
 
 @app.get("/api/posts/{post_id}/comments")
-def list_comments(post_id: str):
-    items = get_documents("comment", {"post_id": post_id})
-    return [{**{k: v for k, v in doc.items() if k != "_id"}, "id": str(doc.get("_id"))} for doc in items]
+async def list_comments(post_id: str, limit: int = 50, cursor: Optional[str] = None):
+    flt, limit = _paged({"post_id": post_id}, limit, cursor)
+    items = await get_documents("comment", flt, limit=limit, sort=[("_id", -1)])
+    items = _serialize_ids(items)
+    return {"items": items, "next_cursor": items[-1]["id"] if len(items) == limit else None}
 
 
 # --- Moderation (non-adult policy) ---
@@ -206,36 +466,101 @@ BLOCKED_KEYWORDS = [
     "nsfw", "adult", "explicit", "18+",
 ]
 
+# Compiled once at import: a single alternation scan beats one Python-level
+# substring search per keyword, and stays linear as the list grows
+_BLOCKED_RE = re.compile("|".join(map(re.escape, BLOCKED_KEYWORDS)), re.IGNORECASE)
+
+# Optional SIMD accelerator: python-hyperscan compiles the keyword list into
+# a vectorized multi-pattern DFA (multi-GB/s scans once the list grows to
+# hundreds of entries). The extension is x86-only and not pinned in
+# requirements, so the compiled regex above remains the fallback.
+try:
+    import hyperscan
+
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[re.escape(k).encode() for k in BLOCKED_KEYWORDS],
+        ids=list(range(len(BLOCKED_KEYWORDS))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(BLOCKED_KEYWORDS),
+    )
+except ImportError:
+    _HS_DB = None
+
+
+def _hs_scan(text: str) -> bool:
+    matched = []
+
+    def _on_match(pattern_id, start, end, flags, context):
+        matched.append(pattern_id)
+        return hyperscan.HS_SCAN_TERMINATED  # first hit is enough
+
+    try:
+        _HS_DB.scan(text.encode(), match_event_handler=_on_match)
+    except hyperscan.ScanTerminated:
+        # Terminating from the callback surfaces as this exception; it just
+        # means we matched and stopped early
+        return True
+    return bool(matched)
+
 
 def violates_policy(text: Optional[str]) -> bool:
     if not text:
         return False
-    t = text.lower()
-    return any(k in t for k in BLOCKED_KEYWORDS)
+    if _HS_DB is not None:
+        return _hs_scan(text)
+    return _BLOCKED_RE.search(text) is not None
 
 
 @app.post("/api/moderate/post")
-def moderate_post(post: Post):
+async def moderate_post(post: Post):
     if violates_policy(post.title) or violates_policy(post.body_text):
         raise HTTPException(status_code=400, detail="Content violates non-adult policy")
-    inserted_id = create_document("post", post)
+    inserted_id = await create_document("post", post)
     return {"id": inserted_id}
 
 
 # --- Simple analytics (creator view) ---
 @app.get("/api/creators/{creator_id}/stats")
-def creator_stats(creator_id: str):
-    subs = db["subscription"].count_documents({"creator_id": creator_id, "active": True})
-    tips = list(db["tokentransaction"].aggregate([
+async def creator_stats(creator_id: str):
+    # Fire the three independent queries concurrently: one round trip of wall
+    # time instead of three serial ones
+    subs_filter = {"creator_id": creator_id, "active": True}
+    tips_pipeline = [
         {"$match": {"to_user_id": creator_id, "kind": "tip"}},
         {"$group": {"_id": None, "total": {"$sum": "$amount"}}}
-    ]))
+    ]
+    posts_filter = {"creator_id": creator_id}
+    try:
+        # Hints pin the counts to their covering indexes, skipping the planner
+        subs, tips, posts_count = await asyncio.gather(
+            db["subscription"].count_documents(subs_filter, hint=[("creator_id", 1), ("active", 1)]),
+            db["tokentransaction"].aggregate(tips_pipeline).to_list(1),
+            db["post"].count_documents(posts_filter, hint=[("creator_id", 1)]),
+        )
+    except OperationFailure:
+        # A backing index may be missing when its startup build was skipped;
+        # an unhinted (slower) count beats a permanent 500
+        logger.warning("creator_stats hints failed; retrying without hints", exc_info=True)
+        subs, tips, posts_count = await asyncio.gather(
+            db["subscription"].count_documents(subs_filter),
+            db["tokentransaction"].aggregate(tips_pipeline).to_list(1),
+            db["post"].count_documents(posts_filter),
+        )
     total_tips = tips[0]["total"] if tips else 0
-    posts_count = db["post"].count_documents({"creator_id": creator_id})
     return {"active_subscribers": subs, "total_tips": total_tips, "posts": posts_count}
 
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Import string (not the app object) so each worker process imports the
+    # module fresh and owns its Motor client/connection pool
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        log_level="warning",
+    )
@@ -8,12 +8,17 @@ These schemas are used for validation before inserting into MongoDB via
 helper functions in database.py
 """
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from typing import Optional, List, Literal
-from datetime import datetime
+from datetime import datetime, timezone
+
+# Shared config keeping pydantic-core on its fast validation paths
+_config = ConfigDict(populate_by_name=True, str_strip_whitespace=False)
 
 # Core users
 class User(BaseModel):
+    model_config = _config
+
     name: str = Field(..., description="Display name")
     email: EmailStr = Field(..., description="Email address")
     is_creator: bool = Field(False, description="Whether user is a creator")
@@ -24,6 +29,8 @@ class User(BaseModel):
 
 # Creator profile (separate so we can extend without cluttering User)
 class CreatorProfile(BaseModel):
+    model_config = _config
+
     user_id: str = Field(..., description="Owner user id string")
     handle: str = Field(..., min_length=3, max_length=30, description="Unique creator handle")
     headline: Optional[str] = Field(None, description="Tagline shown on profile")
@@ -32,6 +39,8 @@ class CreatorProfile(BaseModel):
 
 # Subscription tiers set by creators
 class SubscriptionTier(BaseModel):
+    model_config = _config
+
     creator_id: str = Field(..., description="Creator user id")
     name: str = Field(..., description="Tier name")
     description: Optional[str] = Field(None, description="Tier benefits")
@@ -41,14 +50,18 @@ class SubscriptionTier(BaseModel):
 
 # Active subscriptions by audience
 class Subscription(BaseModel):
+    model_config = _config
+
     user_id: str = Field(..., description="Subscriber user id")
     creator_id: str = Field(..., description="Creator user id")
     tier_id: str = Field(..., description="Tier id subscribed to")
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     active: bool = Field(True)
 
 # Media assets uploaded/referenced by posts
 class MediaAsset(BaseModel):
+    model_config = _config
+
     creator_id: str = Field(...)
     url: str = Field(..., description="Where the asset is hosted (demo: direct URL)")
     media_type: Literal["video","image","file","code","text"] = Field(...)
@@ -57,6 +70,8 @@ class MediaAsset(BaseModel):
 
 # Posts (content units)
 class Post(BaseModel):
+    model_config = _config
+
     creator_id: str = Field(...)
     title: str = Field(...)
     body_text: Optional[str] = None
@@ -68,6 +83,8 @@ class Post(BaseModel):
 
 # Token transactions (tips and purchases)
 class TokenTransaction(BaseModel):
+    model_config = _config
+
     from_user_id: Optional[str] = Field(None, description="Who sent tokens (None for purchase)")
     to_user_id: Optional[str] = Field(None, description="Creator who received tokens")
     amount: int = Field(..., ge=1)
@@ -75,14 +92,20 @@ class TokenTransaction(BaseModel):
     note: Optional[str] = None
     post_id: Optional[str] = None
 
-# Comments on posts (subscribers only)
+# Comments on posts (subscribers only). creator_id is denormalized from the
+# post so the subscription check needs no post lookup.
 class Comment(BaseModel):
+    model_config = _config
+
     post_id: str
     user_id: str
+    creator_id: str
     text: str
 
 # Simple moderation report
 class Report(BaseModel):
+    model_config = _config
+
     target_type: Literal["post","comment","user"]
     target_id: str
     reason: str